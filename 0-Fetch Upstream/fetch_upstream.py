@@ -0,0 +1,290 @@
+"""
+Crossref Upstream Fetcher
+
+This script downloads the Crossref Swagger UI page and the API description it
+renders, using ETag/Last-Modified validation so unchanged documents are not
+transferred again. Response bodies are stored in a local content-addressed
+cache and combined into a fingerprint of the upstream documentation.
+
+If the fingerprint matches the one recorded after the last successful build,
+stages 1 through 5 are skipped entirely. Otherwise the stages are run in order
+and the new fingerprint is recorded once all of them succeed.
+
+Requirements:
+    - requests
+
+Usage:
+    1. Run the script from the repository root: python "0-Fetch Upstream/fetch_upstream.py"
+    2. Use --check to only report whether the stages need to run
+    3. Use --force to run the stages even if nothing has changed
+    4. Use --swagger-url/--docs-url to point at a different upstream
+       (for example a local HTTP server)
+    5. The script will create:
+       - cache/objects/<sha256>: Downloaded response bodies
+       - cache/index.json: Validators and body hash for each URL
+       - cache/last_build.json: Fingerprint of the last successful build
+
+License: MIT
+"""
+
+# -*- coding: utf-8 -*-
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+import requests
+
+SWAGGER_URL = "https://api.crossref.org/swagger-ui/index.html"
+DOCS_URL = "https://api.crossref.org/swagger-docs"
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, 'cache')
+
+# Pipeline stages, run from the repository root in this order
+STAGES = [
+    os.path.join('1-Get JSON Raw', 'crossref_json_model.py'),
+    os.path.join('2-Get Raw HTML Components', 'crossref_model_preserver.py'),
+    os.path.join('3-Fill Out Empty Values', 'extract_empty_objects.py'),
+    os.path.join('4-Fill Empty Objects', 'fill_empty_objects.py'),
+    os.path.join('5-Combine JSON & Filled Empty', 'update_empty_objects.py'),
+]
+
+# Progress files stages 1 and 2 use to resume an interrupted scrape
+RESUME_FILES = [
+    os.path.join('1-Get JSON Raw', 'expansion_progress.json'),
+    os.path.join('2-Get Raw HTML Components', 'expansion_progress.txt'),
+]
+
+
+def load_json(path, default):
+    """
+    Load a JSON file, falling back to a default if it does not exist.
+
+    Args:
+        path (str): Path to the JSON file
+        default: Value returned when the file is missing
+
+    Returns:
+        The decoded JSON content or the default value
+    """
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return default
+
+
+def save_json(path, data):
+    """
+    Write data to a JSON file, replacing it atomically.
+
+    Args:
+        path (str): Path to the JSON file
+        data: JSON-serialisable data to write
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def object_path(cache_dir, digest):
+    """Return the cache path of the body with the given SHA-256 digest."""
+    return os.path.join(cache_dir, 'objects', digest)
+
+
+def store_object(cache_dir, body):
+    """
+    Store a response body in the content-addressed cache.
+
+    Args:
+        cache_dir (str): Root directory of the cache
+        body (bytes): Response body to store
+
+    Returns:
+        str: SHA-256 hex digest under which the body is stored
+    """
+    digest = hashlib.sha256(body).hexdigest()
+    path = object_path(cache_dir, digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    return digest
+
+
+def fetch(session, url, entry, cache_dir, timeout=30):
+    """
+    Fetch a URL, revalidating against the cached ETag/Last-Modified.
+
+    Args:
+        session (requests.Session): Session used for the request
+        url (str): URL to fetch
+        entry (dict): Cached index entry for the URL, empty if unseen
+        cache_dir (str): Root directory of the cache
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        dict: Updated index entry with 'sha256', 'etag' and 'last_modified'
+
+    Note:
+        Validators are only sent when the cached body is still present, so a
+        partially deleted cache always falls back to a full download.
+    """
+    headers = {}
+    if entry.get('sha256') and os.path.exists(object_path(cache_dir, entry['sha256'])):
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and headers:
+        print(f"Not modified: {url}")
+        return entry
+
+    response.raise_for_status()
+    digest = store_object(cache_dir, response.content)
+    print(f"Downloaded {len(response.content)} bytes from {url}")
+    return {
+        'sha256': digest,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+
+
+def fingerprint(index, urls):
+    """
+    Combine the body hashes of the given URLs into a single fingerprint.
+
+    Args:
+        index (dict): Cache index mapping URLs to their entries
+        urls (list): URLs that make up the upstream documentation
+
+    Returns:
+        str: SHA-256 hex digest identifying the upstream content
+    """
+    digest = hashlib.sha256()
+    for url in urls:
+        digest.update(url.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(index[url]['sha256'].encode('ascii'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def fetch_upstream(urls, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Fetch all upstream documents and compute their combined fingerprint.
+
+    Args:
+        urls (list): URLs that make up the upstream documentation
+        cache_dir (str): Root directory of the cache
+
+    Returns:
+        str: Fingerprint of the current upstream content
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, 'index.json')
+    index = load_json(index_path, {})
+
+    with requests.Session() as session:
+        for url in urls:
+            index[url] = fetch(session, url, index.get(url, {}), cache_dir)
+            save_json(index_path, index)
+
+    return fingerprint(index, urls)
+
+
+def is_up_to_date(current, cache_dir=DEFAULT_CACHE_DIR):
+    """Return True if the fingerprint matches the last successful build."""
+    last_build = load_json(os.path.join(cache_dir, 'last_build.json'), {})
+    return last_build.get('fingerprint') == current
+
+
+def record_build(current, cache_dir=DEFAULT_CACHE_DIR):
+    """Record the fingerprint of a successful build."""
+    save_json(os.path.join(cache_dir, 'last_build.json'), {'fingerprint': current})
+
+
+def clear_resume_files(resume_files=RESUME_FILES, cwd=REPO_ROOT):
+    """
+    Remove the resume progress of stages 1 and 2 so every model is scraped again.
+
+    Args:
+        resume_files (list): Progress file paths relative to cwd
+        cwd (str): Directory the paths are relative to
+    """
+    for resume_file in resume_files:
+        path = os.path.join(cwd, resume_file)
+        if os.path.exists(path):
+            print(f"Removing resume progress: {resume_file}")
+            os.remove(path)
+
+
+def run_stages(stages=STAGES, cwd=REPO_ROOT):
+    """
+    Run the pipeline stages in order, stopping at the first failure.
+
+    Args:
+        stages (list): Stage script paths relative to cwd
+        cwd (str): Directory the stages are run from
+
+    Returns:
+        bool: True if every stage exited successfully, False otherwise
+    """
+    for stage in stages:
+        print(f"Running stage: {stage}")
+        result = subprocess.run([sys.executable, stage], cwd=cwd)
+        if result.returncode != 0:
+            print(f"Stage failed with exit code {result.returncode}: {stage}")
+            return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch the Crossref API documentation and rebuild the models if it changed.")
+    parser.add_argument('--swagger-url', default=SWAGGER_URL, help="URL of the Swagger UI page")
+    parser.add_argument('--docs-url', default=DOCS_URL, help="URL of the API description")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory for the local cache")
+    parser.add_argument('--check', action='store_true', help="Only report whether the stages need to run (ignores --force)")
+    parser.add_argument('--force', action='store_true', help="Run the stages even if nothing has changed")
+    args = parser.parse_args(argv)
+
+    try:
+        current = fetch_upstream([args.swagger_url, args.docs_url], args.cache_dir)
+    except requests.RequestException as e:
+        print(f"Error fetching upstream documentation: {e}")
+        return 2
+
+    print(f"Upstream fingerprint: {current}")
+    up_to_date = is_up_to_date(current, args.cache_dir)
+    if args.check:
+        if up_to_date:
+            print("Upstream documentation unchanged since the last build")
+            return 0
+        print("Upstream documentation changed, stages 1-5 need to run")
+        return 1
+
+    if up_to_date and not args.force:
+        print("Upstream documentation unchanged since the last build, skipping stages 1-5")
+        return 0
+
+    # A rebuild must re-scrape every model, not resume a previous run
+    clear_resume_files()
+    if not run_stages():
+        return 1
+
+    record_build(current, args.cache_dir)
+    print("Build complete, fingerprint recorded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,7 @@ Requirements:
 Usage:
     1. Update chrome_driver_path if necessary
     2. Run the script: python crossref_json_model.py
-    3. The script will create:
+    3. The script will create (next to this script):
        - crossref_models_expanded.json: Contains the full JSON model
        - expansion_progress.json: Tracks progress for resumption
 
@@ -36,6 +36,10 @@ import json
 import time
 import os
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROGRESS_PATH = os.path.join(SCRIPT_DIR, 'expansion_progress.json')
+MODELS_PATH = os.path.join(SCRIPT_DIR, 'crossref_models_expanded.json')
+
 # Set up Chrome with WebDriver
 # TODO: Use webdriver_manager instead of local ChromeDriver for better portability
 chrome_driver_path = r"D:\Archives\Misc\chromedriver-win64\chromedriver.exe"
@@ -48,7 +52,7 @@ def save_progress(progress_data):
     Args:
         progress_data (dict): Dictionary containing processed model box information
     """
-    with open('expansion_progress.json', 'w') as f:
+    with open(PROGRESS_PATH, 'w') as f:
         json.dump(progress_data, f)
 
 def load_progress():
@@ -59,8 +63,8 @@ def load_progress():
         dict: Dictionary containing previously processed model box information
               or empty dict with initialized 'processed_model_boxes' list
     """
-    if os.path.exists('expansion_progress.json'):
-        with open('expansion_progress.json', 'r') as f:
+    if os.path.exists(PROGRESS_PATH):
+        with open(PROGRESS_PATH, 'r') as f:
             return json.load(f)
     return {'processed_model_boxes': []}
 
@@ -206,8 +210,8 @@ def get_crossref_models():
         model_boxes = models_section.find_elements(By.CSS_SELECTOR, "span.model-box")
         print(f"Found {len(model_boxes)} model boxes to process")
 
-        if os.path.exists('crossref_models_expanded.json'):
-            with open('crossref_models_expanded.json', 'r', encoding='utf-8') as f:
+        if os.path.exists(MODELS_PATH):
+            with open(MODELS_PATH, 'r', encoding='utf-8') as f:
                 models_data = json.load(f)
         else:
             models_data = {}
@@ -234,7 +238,7 @@ def get_crossref_models():
                     progress['processed_model_boxes'].append(model_name)
 
                     save_progress(progress)
-                    with open('crossref_models_expanded.json', 'w', encoding='utf-8') as f:
+                    with open(MODELS_PATH, 'w', encoding='utf-8') as f:
                         json.dump(models_data, f, ensure_ascii=False, indent=2)
 
                     print(f"Successfully processed {model_name}")
@@ -9,17 +9,21 @@ from selenium.common.exceptions import TimeoutException
 import time
 import os
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROGRESS_PATH = os.path.join(SCRIPT_DIR, 'expansion_progress.txt')
+MODELS_DIR = os.path.join(SCRIPT_DIR, 'models')
+
 # Set up Chrome with your local ChromeDriver
 chrome_driver_path = r"D:\Archives\Misc\chromedriver-win64\chromedriver.exe"
 service = Service(executable_path=chrome_driver_path)
 
 def save_progress(progress_data):
-    with open('expansion_progress.txt', 'w') as f:
+    with open(PROGRESS_PATH, 'w') as f:
         f.write('\n'.join(progress_data['processed_model_boxes']))
 
 def load_progress():
-    if os.path.exists('expansion_progress.txt'):
-        with open('expansion_progress.txt', 'r') as f:
+    if os.path.exists(PROGRESS_PATH):
+        with open(PROGRESS_PATH, 'r') as f:
             processed_models = f.read().splitlines()
             return {'processed_model_boxes': processed_models}
     return {'processed_model_boxes': []}
@@ -78,8 +82,8 @@ def preserve_model_box(model_box):
         html_content = model_box.get_attribute('outerHTML')
         
         # Save each model in its own HTML file
-        filename = f"models/{model_name.replace(' ', '_')}.html"
-        os.makedirs('models', exist_ok=True)
+        filename = os.path.join(MODELS_DIR, f"{model_name.replace(' ', '_')}.html")
+        os.makedirs(MODELS_DIR, exist_ok=True)
         
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -1,4 +1,8 @@
 import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 
 def find_empty_objects(obj, path=""):
     empty_objects = {}
@@ -19,14 +23,14 @@ def find_empty_objects(obj, path=""):
     return empty_objects
 
 # Read the JSON file
-with open('crossref_models_expanded.json', 'r') as f:
+with open(os.path.join(REPO_ROOT, '1-Get JSON Raw', 'crossref_models_expanded.json'), 'r') as f:
     data = json.load(f)
 
 # Find all empty objects
 empty_objects = find_empty_objects(data)
 
 # Write results to a new JSON file
-with open('empty_objects.json', 'w', encoding='utf-8') as f:
+with open(os.path.join(SCRIPT_DIR, 'empty_objects.json'), 'w', encoding='utf-8') as f:
     json.dump(empty_objects, f, indent=2, sort_keys=True)
 
 print(f"Found {len(empty_objects)} components with empty objects. Results written to empty_objects.json")
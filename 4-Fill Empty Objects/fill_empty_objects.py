@@ -3,6 +3,9 @@ import os
 from bs4 import BeautifulSoup
 import re
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
 def find_nested_type(soup, path_parts):
     current_element = soup
     for part in path_parts:
@@ -69,7 +72,7 @@ def find_nested_type(soup, path_parts):
 
 def process_empty_objects():
     # Read the empty objects file
-    with open('3-Fill Out Empty Values/empty_objects.json', 'r') as f:
+    with open(os.path.join(REPO_ROOT, '3-Fill Out Empty Values', 'empty_objects.json'), 'r') as f:
         empty_objects = json.load(f)
     
     filled_objects = {}
@@ -86,7 +89,7 @@ def process_empty_objects():
         if not property_path:
             continue
             
-        html_file = f'2-Get Raw HTML Components/models/{file_name}.html'
+        html_file = os.path.join(REPO_ROOT, '2-Get Raw HTML Components', 'models', f'{file_name}.html')
         
         if not os.path.exists(html_file):
             print(f"Warning: {html_file} not found")
@@ -104,7 +107,7 @@ def process_empty_objects():
             print(f"Warning: Could not find type for {key}")
     
     # Write the result to a new file
-    with open('filled_objects.json', 'w') as f:
+    with open(os.path.join(SCRIPT_DIR, 'filled_objects.json'), 'w') as f:
         json.dump(filled_objects, f, indent=2)
 
 if __name__ == "__main__":
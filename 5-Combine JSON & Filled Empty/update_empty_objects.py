@@ -70,7 +70,7 @@ def update_value_at_path(obj, path, new_value):
 
 def main():
     # File paths
-    base_dir = 'd:/Repositories/crossref_json_model'
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     expanded_model_path = os.path.join(base_dir, '1-Get JSON Raw', 'crossref_models_expanded.json')
     filled_objects_path = os.path.join(base_dir, '4-Fill Empty Objects', 'filled_objects.json')
     output_path = os.path.join(base_dir, '5-Combine JSON & Filled Empty', 'crossref_models_expanded_updated.json')
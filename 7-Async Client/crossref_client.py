@@ -0,0 +1,386 @@
+"""
+Crossref Async Works Client
+
+This script pages through the Crossref /works endpoint using deep-paging cursors
+and decodes each page into the Work model produced by stages 1-5. It uses a
+single pooled aiohttp session and bounds the number of requests in flight, so
+several queries can be paged concurrently without overloading the API.
+
+While a page is being decoded the request for the next page is already in
+flight. Requests are paced according to the X-Rate-Limit-Limit and
+X-Rate-Limit-Interval response headers, and 429/5xx responses are retried with
+exponential backoff (honouring Retry-After when present).
+
+Requirements:
+    - aiohttp
+
+Usage:
+    1. Run the script: python "7-Async Client/crossref_client.py" --filter from-pub-date:2024-01-01
+    2. Use --base-url to point at a different server (for example a local stub)
+    3. The script will print:
+       - Throughput in records per second
+       - Per-request latency percentiles (p50/p90/p99)
+
+License: MIT
+"""
+
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+
+import aiohttp
+
+BASE_URL = "https://api.crossref.org"
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+SPEC_PATH = os.path.join(REPO_ROOT, '5-Combine JSON & Filled Empty', 'crossref_models_expanded_updated.json')
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def load_item_model(spec_path=SPEC_PATH, model_name='Work'):
+    """
+    Load a single model definition from the combined JSON model.
+
+    Args:
+        spec_path (str): Path to crossref_models_expanded_updated.json
+        model_name (str): Name of the model to load
+
+    Returns:
+        dict: Model definition mapping property names to their types
+    """
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        return json.load(f)[model_name]
+
+
+def decode(value, model):
+    """
+    Decode a JSON value into the shape described by a model definition.
+
+    Args:
+        value: Decoded JSON value from an API response
+        model: Model definition (dict, list or type name string)
+
+    Returns:
+        The value with integer and number leaves converted to their Python
+        types; properties the model does not describe are kept unchanged
+
+    Note:
+        The scraped models describe arrays of objects as plain objects, and
+        some array properties as plain types, so lists are decoded element by
+        element whenever the model does not say otherwise. The models are
+        also incomplete (for example 'relation' is keyed by relation type in
+        the API), so nothing is dropped and floats are never truncated.
+    """
+    if value is None:
+        return None
+    if isinstance(value, list):
+        item_model = model[0] if isinstance(model, list) and model else model
+        return [decode(item, item_model) for item in value]
+    if isinstance(model, dict):
+        if not isinstance(value, dict):
+            return value
+        return {key: decode(item, model[key]) if key in model else item for key, item in value.items()}
+    if isinstance(model, list):
+        return value
+
+    try:
+        if model.startswith('integer') and isinstance(value, str):
+            return int(value)
+        if model == 'number' and not isinstance(value, bool):
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def decode_page(items, model):
+    """Decode every item of a page into the given model."""
+    return [decode(item, model) for item in items]
+
+
+def percentile(values, pct):
+    """
+    Compute a percentile of a list of values using the nearest-rank method.
+
+    Args:
+        values (list): Values to compute the percentile of
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value, or 0.0 if values is empty
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def parse_interval(value):
+    """Parse an X-Rate-Limit-Interval header such as '1s' into seconds."""
+    value = value.strip().lower()
+    units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+    for suffix in sorted(units, key=len, reverse=True):
+        if value.endswith(suffix):
+            return float(value[:-len(suffix)]) * units[suffix]
+    return float(value)
+
+
+class CrossrefClient:
+    """
+    Pooled asyncio client for cursor-based paging of the Crossref /works endpoint.
+
+    Args:
+        base_url (str): Base URL of the Crossref API
+        mailto (str): Contact address sent to use the polite pool
+        max_concurrency (int): Maximum number of requests in flight
+        max_retries (int): Retries for rate-limited or failed requests
+        backoff (float): Initial backoff delay in seconds
+        timeout (int): Request timeout in seconds
+        model (dict): Item model to decode into, loaded from the spec by default
+    """
+
+    def __init__(self, base_url=BASE_URL, mailto=None, max_concurrency=4,
+                 max_retries=5, backoff=1.0, timeout=60, model=None):
+        self.base_url = base_url.rstrip('/')
+        self.mailto = mailto
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.model = model if model is not None else load_item_model()
+
+        self.session = None
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_lock = asyncio.Lock()
+        self.min_interval = 0.0
+        self.next_request_at = 0.0
+
+        self.latencies = []
+        self.retries = 0
+        self.retry_wait = 0.0
+        self.records = 0
+        self.started_at = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self.started_at = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def wait_for_slot(self):
+        """Wait until the rate limit allows another request to start."""
+        async with self.rate_lock:
+            now = time.monotonic()
+            if self.next_request_at > now:
+                await asyncio.sleep(self.next_request_at - now)
+                now = self.next_request_at
+            self.next_request_at = now + self.min_interval
+
+    def update_rate_limit(self, headers):
+        """Update the request pacing from the rate-limit response headers."""
+        try:
+            limit = int(headers['X-Rate-Limit-Limit'])
+            interval = parse_interval(headers['X-Rate-Limit-Interval'])
+        except (KeyError, ValueError):
+            return
+        if limit > 0:
+            self.min_interval = interval / limit
+
+    async def get_json(self, path, params):
+        """
+        Perform a GET request, retrying with backoff on rate limiting and errors.
+
+        Args:
+            path (str): Path relative to the base URL
+            params (dict): Query string parameters
+
+        Returns:
+            dict: Decoded JSON response
+
+        Note:
+            A latency is recorded for every attempt, including failed and
+            rate-limited ones; retries and the time spent waiting before
+            them are counted separately in stats().
+        """
+        url = f"{self.base_url}{path}"
+        if self.mailto:
+            params = dict(params, mailto=self.mailto)
+
+        for attempt in range(self.max_retries + 1):
+            await self.wait_for_slot()
+            async with self.semaphore:
+                started = time.perf_counter()
+                try:
+                    async with self.session.get(url, params=params) as response:
+                        self.update_rate_limit(response.headers)
+                        if response.status not in RETRY_STATUSES:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+                        retry_after = response.headers.get('Retry-After')
+                        error = f"HTTP {response.status}"
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    retry_after = None
+                    error = repr(e)
+                finally:
+                    self.latencies.append(time.perf_counter() - started)
+
+            if attempt == self.max_retries:
+                raise RuntimeError(f"Giving up on {url} after {attempt + 1} attempts: {error}")
+
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = self.backoff * 2 ** attempt
+            print(f"Retrying {url} in {delay:.1f}s ({error})")
+            self.retries += 1
+            self.retry_wait += delay
+            await asyncio.sleep(delay)
+
+    async def iter_works(self, params=None, rows=1000, max_records=None):
+        """
+        Iterate over /works results using deep-paging cursors.
+
+        Args:
+            params (dict): Extra query parameters such as filter or query
+            rows (int): Number of items requested per page
+            max_records (int): Stop after this many records, None for all
+
+        Yields:
+            list: Decoded items of each page, in order
+
+        Note:
+            The next page is requested before the current one is yielded. If
+            iteration stops early, close the generator (for example with
+            contextlib.aclosing) so that request is cancelled immediately
+            instead of when the generator is garbage collected.
+        """
+        params = dict(params or {}, rows=rows)
+        loop = asyncio.get_running_loop()
+        fetched = 0
+
+        pending = asyncio.ensure_future(self.get_json('/works', dict(params, cursor='*')))
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                message = page.get('message', {})
+                items = message.get('items', [])
+                if max_records is not None:
+                    items = items[:max_records - fetched]
+                fetched += len(items)
+
+                cursor = message.get('next-cursor')
+                if items and cursor and (max_records is None or fetched < max_records):
+                    pending = asyncio.ensure_future(self.get_json('/works', dict(params, cursor=cursor)))
+
+                # Decode off the event loop so the next request keeps progressing
+                decoded = await loop.run_in_executor(None, decode_page, items, self.model)
+                self.records += len(decoded)
+                if decoded:
+                    yield decoded
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def stats(self):
+        """
+        Summarise throughput and request latency so far.
+
+        Returns:
+            dict: Records, request attempts, retries, time spent waiting to
+                  retry, records per second and attempt latency percentiles in ms
+        """
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            'records': self.records,
+            'requests': len(self.latencies),
+            'retries': self.retries,
+            'retry_wait_s': self.retry_wait,
+            'records_per_second': self.records / elapsed if elapsed else 0.0,
+            'latency_ms': {
+                'p50': percentile(self.latencies, 50) * 1000,
+                'p90': percentile(self.latencies, 90) * 1000,
+                'p99': percentile(self.latencies, 99) * 1000,
+            },
+        }
+
+
+async def fetch_works(client, queries, rows=1000, max_records=None):
+    """
+    Page through several /works queries concurrently.
+
+    Args:
+        client (CrossrefClient): Open client used for all requests
+        queries (list): Query parameter dicts, one cursor stream each
+        rows (int): Number of items requested per page
+        max_records (int): Record limit per query, None for all
+
+    Returns:
+        list: One list of decoded items per query
+    """
+    async def collect(params):
+        results = []
+        async with contextlib.aclosing(client.iter_works(params, rows=rows, max_records=max_records)) as pages:
+            async for items in pages:
+                results.extend(items)
+        return results
+
+    return await asyncio.gather(*(collect(params) for params in queries))
+
+
+async def run(args):
+    queries = [{'filter': f} for f in args.filter] or [{}]
+    if args.query:
+        for params in queries:
+            params['query'] = args.query
+
+    async with CrossrefClient(base_url=args.base_url, mailto=args.mailto,
+                              max_concurrency=args.concurrency) as client:
+        results = await fetch_works(client, queries, rows=args.rows, max_records=args.max_records)
+        stats = client.stats()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([item for items in results for item in items], f, ensure_ascii=False, indent=2)
+        print(f"Saved {stats['records']} records to {args.output}")
+
+    latency = stats['latency_ms']
+    print(f"Fetched {stats['records']} records in {stats['requests']} requests "
+          f"({stats['records_per_second']:.1f} records/s)")
+    print(f"Retried {stats['retries']} requests, waiting {stats['retry_wait_s']:.1f}s in total")
+    print(f"Latency p50={latency['p50']:.1f}ms p90={latency['p90']:.1f}ms p99={latency['p99']:.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page through Crossref /works results with cursors.")
+    parser.add_argument('--base-url', default=BASE_URL, help="Base URL of the Crossref API")
+    parser.add_argument('--filter', action='append', default=[], help="Filter for one cursor stream, may be repeated")
+    parser.add_argument('--query', help="Free-text query applied to every stream")
+    parser.add_argument('--rows', type=int, default=1000, help="Items per page")
+    parser.add_argument('--max-records', type=int, help="Record limit per stream")
+    parser.add_argument('--concurrency', type=int, default=4, help="Maximum requests in flight")
+    parser.add_argument('--mailto', help="Contact address for the polite pool")
+    parser.add_argument('--output', help="Write the decoded records to this JSON file")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
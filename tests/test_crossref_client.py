@@ -0,0 +1,143 @@
+import asyncio
+import contextlib
+import importlib.util
+import os
+import time
+
+from aiohttp import web
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    'crossref_client', os.path.join(REPO_ROOT, '7-Async Client', 'crossref_client.py'))
+crossref_client = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(crossref_client)
+
+MODEL = {'DOI': 'string', 'reference-count': 'integer', 'score': 'number'}
+
+
+class StubCrossref:
+    """Stand-in for /works serving a fixed number of pages through cursors."""
+
+    def __init__(self, pages=3, rows=5, rate_limit=None, fail_first=None, delays=None):
+        self.pages = pages
+        self.rows = rows
+        self.rate_limit = rate_limit
+        self.fail_first = fail_first
+        self.delays = delays or {}
+        self.requests = []
+
+    async def works(self, request):
+        cursor = request.query['cursor']
+        self.requests.append((time.monotonic(), cursor, dict(request.query)))
+        if self.fail_first and len(self.requests) == 1:
+            return web.Response(status=self.fail_first[0], headers={'Retry-After': self.fail_first[1]})
+
+        page = 0 if cursor == '*' else int(cursor[1:])
+        await asyncio.sleep(self.delays.get(page, 0))
+        items = [] if page >= self.pages else [
+            {'DOI': f'10.1/{page}-{i}', 'reference-count': str(i), 'score': 1.5, 'extra': [page]}
+            for i in range(self.rows)
+        ]
+        headers = {}
+        if self.rate_limit:
+            headers = {'X-Rate-Limit-Limit': str(self.rate_limit[0]), 'X-Rate-Limit-Interval': self.rate_limit[1]}
+        message = {'next-cursor': f'c{page + 1}', 'total-results': self.pages * self.rows, 'items': items}
+        return web.json_response({'status': 'ok', 'message-type': 'work-list', 'message': message}, headers=headers)
+
+    @contextlib.asynccontextmanager
+    async def serve(self):
+        app = web.Application()
+        app.router.add_get('/works', self.works)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        try:
+            yield 'http://127.0.0.1:%d' % runner.addresses[0][1]
+        finally:
+            await runner.cleanup()
+
+
+def fetch(stub, queries=({},), **kwargs):
+    """Run fetch_works against the stub and return the results and client stats."""
+    async def run():
+        async with stub.serve() as base_url:
+            async with crossref_client.CrossrefClient(base_url=base_url, backoff=0.01, model=MODEL) as client:
+                results = await crossref_client.fetch_works(client, list(queries), rows=stub.rows, **kwargs)
+                return results, client.stats()
+    return asyncio.run(run())
+
+
+def test_cursor_chaining():
+    stub = StubCrossref(pages=3)
+    results, stats = fetch(stub, queries=[{'filter': 'type:journal-article'}])
+
+    assert [cursor for _, cursor, _ in stub.requests] == ['*', 'c1', 'c2', 'c3']
+    assert all(query['filter'] == 'type:journal-article' for _, _, query in stub.requests)
+    assert [item['DOI'] for item in results[0]] == [f'10.1/{p}-{i}' for p in range(3) for i in range(5)]
+    assert results[0][1] == {'DOI': '10.1/0-1', 'reference-count': 1, 'score': 1.5, 'extra': [0]}
+    assert stats['records'] == 15
+    assert stats['requests'] == 4
+
+
+def test_max_records_truncation():
+    stub = StubCrossref(pages=3)
+    results, stats = fetch(stub, max_records=7)
+
+    assert len(results[0]) == 7
+    assert [cursor for _, cursor, _ in stub.requests] == ['*', 'c1']
+    assert stats['records'] == 7
+
+
+def test_retry_after_on_429():
+    stub = StubCrossref(pages=1, fail_first=(429, '0.2'))
+    results, stats = fetch(stub)
+
+    assert len(results[0]) == 5
+    assert [cursor for _, cursor, _ in stub.requests] == ['*', '*', 'c1']
+    assert stub.requests[1][0] - stub.requests[0][0] >= 0.2
+    assert stats['requests'] == 3
+    assert stats['retries'] == 1
+    assert stats['retry_wait_s'] == 0.2
+
+
+def test_rate_limit_header_pacing():
+    stub = StubCrossref(pages=3, rate_limit=(10, '1s'))
+    fetch(stub)
+
+    starts = [started for started, _, _ in stub.requests]
+    assert len(starts) == 4
+    assert all(later - earlier >= 0.09 for earlier, later in zip(starts[1:], starts[2:]))
+
+
+def test_closing_early_cancels_prefetch():
+    stub = StubCrossref(pages=3, delays={1: 1})
+
+    async def run():
+        async with stub.serve() as base_url:
+            async with crossref_client.CrossrefClient(base_url=base_url, model=MODEL) as client:
+                async with contextlib.aclosing(client.iter_works(rows=stub.rows)) as pages:
+                    async for items in pages:
+                        prefetches = [task for task in asyncio.all_tasks() if task.get_coro().__name__ == 'get_json']
+                        break
+                await asyncio.sleep(0)
+                return prefetches
+
+    prefetches = asyncio.run(run())
+    assert len(prefetches) == 1
+    assert prefetches[0].cancelled()
+
+
+def test_decode_keeps_unmodelled_data():
+    item = {
+        'score': 23.87,
+        'reference-count': '12',
+        'relation': {'is-preprint-of': [{'id': '10.1/x', 'id-type': 'doi', 'asserted-by': 'subject'}]},
+        'unknown-field': {'a': 1},
+    }
+    decoded = crossref_client.decode(item, crossref_client.load_item_model())
+
+    assert decoded['score'] == 23.87
+    assert decoded['reference-count'] == 12
+    assert decoded['relation'] == item['relation']
+    assert decoded['unknown-field'] == {'a': 1}
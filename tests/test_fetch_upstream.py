@@ -0,0 +1,120 @@
+import hashlib
+import importlib.util
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    'fetch_upstream', os.path.join(REPO_ROOT, '0-Fetch Upstream', 'fetch_upstream.py'))
+fetch_upstream = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch_upstream)
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    """Serve in-memory documents with ETag validation, recording each status."""
+
+    def do_GET(self):
+        body = self.server.documents[self.path]
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.server.statuses.append((self.path, 304))
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.server.statuses.append((self.path, 200))
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), UpstreamHandler)
+    server.documents = {'/index.html': b'<html>ui</html>', '/swagger-docs': b'{"v": 1}'}
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    runs = []
+    monkeypatch.setattr(fetch_upstream, 'clear_resume_files', lambda: runs.append('clear'))
+    monkeypatch.setattr(fetch_upstream, 'run_stages', lambda: runs.append('run') or True)
+    return runs
+
+
+def urls(server):
+    base = 'http://127.0.0.1:%d' % server.server_address[1]
+    return [base + '/index.html', base + '/swagger-docs']
+
+
+def run_main(server, cache_dir, *flags):
+    swagger_url, docs_url = urls(server)
+    return fetch_upstream.main(['--swagger-url', swagger_url, '--docs-url', docs_url,
+                                '--cache-dir', str(cache_dir), *flags])
+
+
+def test_revalidation_and_fingerprint(upstream, tmp_path):
+    first = fetch_upstream.fetch_upstream(urls(upstream), str(tmp_path))
+    second = fetch_upstream.fetch_upstream(urls(upstream), str(tmp_path))
+
+    assert first == second
+    assert [status for _, status in upstream.statuses] == [200, 200, 304, 304]
+    assert len(os.listdir(tmp_path / 'objects')) == 2
+
+    upstream.documents['/swagger-docs'] = b'{"v": 2}'
+    third = fetch_upstream.fetch_upstream(urls(upstream), str(tmp_path))
+
+    assert third != first
+    assert upstream.statuses[-2:] == [('/index.html', 304), ('/swagger-docs', 200)]
+
+
+def test_refetches_when_cached_body_is_missing(upstream, tmp_path):
+    fetch_upstream.fetch_upstream(urls(upstream), str(tmp_path))
+    for name in os.listdir(tmp_path / 'objects'):
+        os.remove(tmp_path / 'objects' / name)
+
+    fetch_upstream.fetch_upstream(urls(upstream), str(tmp_path))
+
+    assert [status for _, status in upstream.statuses] == [200, 200, 200, 200]
+
+
+def test_stages_skipped_when_unchanged(upstream, tmp_path, stages):
+    assert run_main(upstream, tmp_path) == 0
+    assert stages == ['clear', 'run']
+
+    assert run_main(upstream, tmp_path) == 0
+    assert stages == ['clear', 'run']
+
+    upstream.documents['/index.html'] = b'<html>ui v2</html>'
+    assert run_main(upstream, tmp_path) == 0
+    assert stages == ['clear', 'run', 'clear', 'run']
+
+
+def test_failed_stages_are_not_recorded(upstream, tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_upstream, 'clear_resume_files', lambda: None)
+    monkeypatch.setattr(fetch_upstream, 'run_stages', lambda: False)
+
+    assert run_main(upstream, tmp_path) == 1
+    assert not os.path.exists(tmp_path / 'last_build.json')
+
+
+def test_check_ignores_force(upstream, tmp_path, stages):
+    assert run_main(upstream, tmp_path, '--check') == 1
+    assert run_main(upstream, tmp_path) == 0
+    assert run_main(upstream, tmp_path, '--check', '--force') == 0
+    assert run_main(upstream, tmp_path, '--force') == 0
+    assert stages == ['clear', 'run', 'clear', 'run']